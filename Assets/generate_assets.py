@@ -5,7 +5,12 @@ Creates all visual assets for the Chinese Chess GUI application.
 """
 
 from PIL import Image, ImageDraw, ImageFont, ImageFilter
+import numpy as np
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
 import math
+import multiprocessing
 import os
 
 # Color schemes
@@ -36,6 +41,55 @@ COLORS = {
 
 ASSETS_DIR = os.path.dirname(os.path.abspath(__file__))
 
+# CJK-capable system fonts, in order of preference
+FONT_PATHS = [
+    "/System/Library/Fonts/STHeiti Light.ttc",
+    "/System/Library/Fonts/PingFang.ttc",
+    "/System/Library/Fonts/Hiragino Sans GB.ttc",
+]
+
+# Latin UI fonts for the app name, in order of preference
+NAME_FONT_PATHS = [
+    "/System/Library/Fonts/SFProDisplay-Semibold.otf",
+    "/System/Library/Fonts/Helvetica.ttc",
+]
+
+# Toolbar icons are drawn once at this size and downscaled
+TOOLBAR_MASTER_SIZE = 144
+
+
+@lru_cache(maxsize=None)
+def _pick_font_path():
+    """Return the first usable CJK font path, or None if none can be opened."""
+    for path in FONT_PATHS:
+        if os.path.exists(path):
+            try:
+                ImageFont.truetype(path, 12)
+                return path
+            except OSError:
+                continue
+    return None
+
+
+@lru_cache(maxsize=None)
+def _load_font(size):
+    """Load the CJK font at the given size, cached per size."""
+    path = _pick_font_path()
+    if path is None:
+        return ImageFont.load_default()
+    return ImageFont.truetype(path, size)
+
+
+@lru_cache(maxsize=None)
+def _load_name_font(size):
+    """Load the Latin UI font used for the app name, cached per size."""
+    for path in NAME_FONT_PATHS:
+        try:
+            return ImageFont.truetype(path, size)
+        except OSError:
+            continue
+    return ImageFont.load_default()
+
 
 def save_iconset(image, name, iconset_dir):
     """Save image in all required iconset sizes."""
@@ -54,66 +108,68 @@ def save_iconset(image, name, iconset_dir):
 
     os.makedirs(iconset_dir, exist_ok=True)
 
+    # Downscale as a pyramid: each size is resampled from the next larger
+    # one rather than from the full-size source
+    resized = {}
+    current = image
+    for size in sorted({size for size, _ in sizes}, reverse=True):
+        if current.size != (size, size):
+            current = current.resize((size, size), Image.Resampling.LANCZOS)
+        resized[size] = current
+
     for size, label in sizes:
-        resized = image.resize((size, size), Image.Resampling.LANCZOS)
         filename = f'{name}_{label}.png'
-        resized.save(os.path.join(iconset_dir, filename))
+        resized[size].save(os.path.join(iconset_dir, filename))
 
 
 def create_rounded_rect(draw, xy, radius, fill, outline=None, width=1):
     """Draw a rounded rectangle."""
-    x1, y1, x2, y2 = xy
-    r = radius
-
-    # Draw main rectangle
-    draw.rectangle([x1+r, y1, x2-r, y2], fill=fill)
-    draw.rectangle([x1, y1+r, x2, y2-r], fill=fill)
-
-    # Draw corners
-    draw.ellipse([x1, y1, x1+2*r, y1+2*r], fill=fill)
-    draw.ellipse([x2-2*r, y1, x2, y1+2*r], fill=fill)
-    draw.ellipse([x1, y2-2*r, x1+2*r, y2], fill=fill)
-    draw.ellipse([x2-2*r, y2-2*r, x2, y2], fill=fill)
-
-    if outline:
-        draw.arc([x1, y1, x1+2*r, y1+2*r], 180, 270, fill=outline, width=width)
-        draw.arc([x2-2*r, y1, x2, y1+2*r], 270, 360, fill=outline, width=width)
-        draw.arc([x1, y2-2*r, x1+2*r, y2], 90, 180, fill=outline, width=width)
-        draw.arc([x2-2*r, y2-2*r, x2, y2], 0, 90, fill=outline, width=width)
-        draw.line([(x1+r, y1), (x2-r, y1)], fill=outline, width=width)
-        draw.line([(x1+r, y2), (x2-r, y2)], fill=outline, width=width)
-        draw.line([(x1, y1+r), (x1, y2-r)], fill=outline, width=width)
-        draw.line([(x2, y1+r), (x2, y2-r)], fill=outline, width=width)
+    draw.rounded_rectangle(xy, radius=radius, fill=fill, outline=outline, width=width)
+
+
+def create_ring_glow(size, color, radius, peak, sigma):
+    """Create a soft glowing ring centered in a square RGBA image.
+
+    Alpha peaks at the ring radius and falls off outwards as a Gaussian of
+    width sigma, with a crisp (1px) falloff on the inside, computed for
+    every pixel in a single NumPy pass.
+    """
+    center = size // 2
+    yy, xx = np.ogrid[:size, :size]
+    distance = np.hypot(xx - center, yy - center)
+    spread = np.where(distance < radius, 1.0, sigma)
+    alpha = np.clip(peak * np.exp(-((distance - radius) / spread) ** 2), 0, 255)
+
+    glow = np.zeros((size, size, 4), dtype=np.uint8)
+    glow[..., :3] = color
+    glow[..., 3] = alpha.astype(np.uint8)
+    return Image.fromarray(glow)
 
 
 def create_app_icon():
     """Create the main application icon."""
     size = 1024
-    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
 
     # Background - rounded square with gradient
     bg_color = '#2C2C2E'
     corner_radius = 200
 
-    # Create gradient background
-    for y in range(size):
-        progress = y / size
-        r = int(44 + (60 - 44) * progress)
-        g = int(44 + (60 - 44) * progress)
-        b = int(46 + (64 - 46) * progress)
-        draw.line([(0, y), (size, y)], fill=(r, g, b))
-
     # Mask for rounded corners
     mask = Image.new('L', (size, size), 0)
     mask_draw = ImageDraw.Draw(mask)
     mask_draw.rounded_rectangle([0, 0, size, size], radius=corner_radius, fill=255)
 
-    # Apply background with mask
-    bg = Image.new('RGBA', (size, size))
-    for y in range(size):
-        for x in range(size):
-            bg.putpixel((x, y), img.getpixel((x, y)))
+    # Create gradient background (one row of colors, repeated across the
+    # width), with the rounded mask as its alpha channel
+    progress = np.arange(size, dtype=np.float64)[:, None] / size
+    top = np.array([44, 44, 46])
+    bottom = np.array([60, 60, 64])
+    rows = (top + (bottom - top) * progress).astype(np.uint8)
+    background = np.empty((size, size, 4), dtype=np.uint8)
+    background[..., :3] = rows[:, None, :]
+    background[..., 3] = np.asarray(mask)
+    img = Image.fromarray(background)
+    draw = ImageDraw.Draw(img)
 
     # Draw the chess piece (red "帅" - commander)
     piece_center = (size // 2, size // 2)
@@ -135,15 +191,7 @@ def create_app_icon():
     )
 
     # Draw "帅" character
-    try:
-        # Try to use system font
-        font_size = 240
-        font = ImageFont.truetype("/System/Library/Fonts/STHeiti Light.ttc", font_size)
-    except:
-        try:
-            font = ImageFont.truetype("/System/Library/Fonts/PingFang.ttc", font_size)
-        except:
-            font = ImageFont.load_default()
+    font = _load_font(240)
 
     text = "帅"
     bbox = draw.textbbox((0, 0), text, font=font)
@@ -154,127 +202,127 @@ def create_app_icon():
 
     draw.text((text_x, text_y), text, font=font, fill='#CC0000')
 
-    # Apply rounded mask to final image
-    final_img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    final_img.paste(img, (0, 0), mask)
-
     # Save app icon
     iconset_dir = os.path.join(ASSETS_DIR, 'Icons', 'AppIcon.iconset')
-    save_iconset(final_img, 'AppIcon', iconset_dir)
+    save_iconset(img, 'AppIcon', iconset_dir)
 
     # Also save a combined 1024x1024 version
-    final_img.save(os.path.join(ASSETS_DIR, 'Icons', 'AppIcon_1024.png'))
+    img.save(os.path.join(ASSETS_DIR, 'Icons', 'AppIcon_1024.png'))
 
     print(f"App icon created at: {iconset_dir}")
-    return final_img
+    return img
 
 
-def create_board_styles():
-    """Create different board style textures."""
-    board_dir = os.path.join(ASSETS_DIR, 'BoardStyles')
+def _render_asset(factory, args, out_path):
+    """Build one image with factory(*args) and save it (pool worker entry point)."""
+    factory(*args).save(out_path)
 
-    # Wood style board
-    size = 1024
-    wood_img = Image.new('RGB', (size, size), '#E8D4A2')
-    draw = ImageDraw.Draw(wood_img)
 
-    # Add wood grain texture
-    import random
-    random.seed(42)  # For reproducibility
+def _render_all(jobs):
+    """Render (factory, args, out_path) jobs in parallel across CPU cores."""
+    # Never start more workers than there are jobs (3 boards, 4 launch screens)
+    with multiprocessing.Pool(min(len(jobs), os.cpu_count() or 1)) as pool:
+        pool.starmap(_render_asset, jobs)
 
-    for _ in range(5000):
-        x = random.randint(0, size-1)
-        y = random.randint(0, size-1)
-        length = random.randint(20, 100)
-        color_var = random.randint(-20, 20)
-        base_color = (232, 212, 162)
-        color = tuple(max(0, min(255, c + color_var)) for c in base_color)
-        draw.line([(x, y), (x, y+length)], fill=color, width=1)
 
-    # Draw board grid lines
-    margin = 80
-    grid_size = size - 2 * margin
-    line_color = '#5C4033'
+def _board_style_jobs():
+    """Return (board_dir, jobs) for the board style textures."""
+    board_dir = os.path.join(ASSETS_DIR, 'BoardStyles')
+    os.makedirs(board_dir, exist_ok=True)
 
-    # Horizontal lines
-    for i in range(10):
-        y = margin + i * grid_size // 9
-        draw.line([(margin, y), (size - margin, y)], fill=line_color, width=2)
-
-    # Vertical lines
-    for i in range(9):
-        x = margin + i * grid_size // 8
-        draw.line([(x, margin), (x, margin + 4 * grid_size // 9)], fill=line_color, width=2)
-        draw.line([(x, margin + 5 * grid_size // 9), (x, size - margin)], fill=line_color, width=2)
-
-    # Draw palace diagonals
-    palace_margin_x = margin + 3 * grid_size // 8
-    palace_width = 2 * grid_size // 8
-    palace_top = margin
-    palace_bottom = margin + 4 * grid_size // 9
-    palace_mid_top = margin + 5 * grid_size // 9
-    palace_mid_bottom = size - margin
+    size = 1024
+    return board_dir, [
+        (create_wood_board, (size,), os.path.join(board_dir, 'Board_Wood.png')),
+        (create_modern_board, (size, '#F5F5F7', '#8E8E93'),
+         os.path.join(board_dir, 'Board_Modern_Light.png')),
+        (create_modern_board, (size, '#1C1C1E', '#636366'),
+         os.path.join(board_dir, 'Board_Modern_Dark.png')),
+    ]
 
-    # Top palace
-    draw.line([(palace_margin_x, palace_top), (palace_margin_x + palace_width, palace_bottom)], fill=line_color, width=2)
-    draw.line([(palace_margin_x + palace_width, palace_top), (palace_margin_x, palace_bottom)], fill=line_color, width=2)
 
-    # Bottom palace
-    draw.line([(palace_margin_x, palace_mid_bottom), (palace_margin_x + palace_width, palace_mid_top)], fill=line_color, width=2)
-    draw.line([(palace_margin_x + palace_width, palace_mid_bottom), (palace_margin_x, palace_mid_top)], fill=line_color, width=2)
+def create_board_styles():
+    """Create different board style textures."""
+    board_dir, jobs = _board_style_jobs()
+    _render_all(jobs)
+
+    print(f"Board styles created in: {board_dir}")
 
-    wood_img.save(os.path.join(board_dir, 'Board_Wood.png'))
 
-    # Modern light style
-    modern_light = Image.new('RGB', (size, size), '#F5F5F7')
-    draw = ImageDraw.Draw(modern_light)
+def _draw_board_grid(draw, margin, grid_size, size, color, width):
+    """Draw the 10x9 board grid, river gap and palace diagonals."""
+    ys = [margin + i * grid_size // 9 for i in range(10)]
+    xs = [margin + i * grid_size // 8 for i in range(9)]
+    river_top = ys[4]
+    river_bottom = ys[5]
 
-    # Draw grid
-    line_color = '#8E8E93'
-    for i in range(10):
-        y = margin + i * grid_size // 9
-        draw.line([(margin, y), (size - margin, y)], fill=line_color, width=1)
+    # Horizontal lines
+    for y in ys:
+        draw.line([(margin, y), (size - margin, y)], fill=color, width=width)
 
-    for i in range(9):
-        x = margin + i * grid_size // 8
-        draw.line([(x, margin), (x, margin + 4 * grid_size // 9)], fill=line_color, width=1)
-        draw.line([(x, margin + 5 * grid_size // 9), (x, size - margin)], fill=line_color, width=1)
+    # Vertical lines, broken at the river
+    for x in xs:
+        draw.line([(x, margin), (x, river_top)], fill=color, width=width)
+        draw.line([(x, river_bottom), (x, size - margin)], fill=color, width=width)
 
     # Palace diagonals
-    draw.line([(palace_margin_x, palace_top), (palace_margin_x + palace_width, palace_bottom)], fill=line_color, width=1)
-    draw.line([(palace_margin_x + palace_width, palace_top), (palace_margin_x, palace_bottom)], fill=line_color, width=1)
-    draw.line([(palace_margin_x, palace_mid_bottom), (palace_margin_x + palace_width, palace_mid_top)], fill=line_color, width=1)
-    draw.line([(palace_margin_x + palace_width, palace_mid_bottom), (palace_margin_x, palace_mid_top)], fill=line_color, width=1)
+    left = xs[3]
+    right = xs[5]
+    bottom = size - margin
 
-    modern_light.save(os.path.join(board_dir, 'Board_Modern_Light.png'))
+    # Top palace
+    draw.line([(left, margin), (right, river_top)], fill=color, width=width)
+    draw.line([(right, margin), (left, river_top)], fill=color, width=width)
 
-    # Modern dark style
-    modern_dark = Image.new('RGB', (size, size), '#1C1C1E')
-    draw = ImageDraw.Draw(modern_dark)
+    # Bottom palace
+    draw.line([(left, bottom), (right, river_bottom)], fill=color, width=width)
+    draw.line([(right, bottom), (left, river_bottom)], fill=color, width=width)
+
+
+def create_wood_board(size):
+    """Create the wood style board."""
+    base_color = np.array([232, 212, 162])
+    wood = np.empty((size, size, 3), dtype=np.uint8)
+    wood[:] = base_color
+
+    # Add wood grain texture: 1px vertical streaks, scattered in one pass
+    rng = np.random.default_rng(42)  # For reproducibility
+    streaks = 5000
+    xs = rng.integers(0, size, streaks)
+    ys = rng.integers(0, size, streaks)
+    lengths = rng.integers(20, 101, streaks)
+    color_var = rng.integers(-20, 21, streaks)
+    colors = np.clip(base_color + color_var[:, None], 0, 255).astype(np.uint8)
+
+    offsets = np.arange(lengths.max() + 1)
+    rows = ys[:, None] + offsets
+    covered = (offsets <= lengths[:, None]) & (rows < size)
+    streak_idx, _ = np.nonzero(covered)
+    wood[rows[covered], xs[streak_idx]] = colors[streak_idx]
+
+    wood_img = Image.fromarray(wood)
+    draw = ImageDraw.Draw(wood_img)
 
-    line_color = '#636366'
-    for i in range(10):
-        y = margin + i * grid_size // 9
-        draw.line([(margin, y), (size - margin, y)], fill=line_color, width=1)
+    # Draw board grid lines
+    margin = 80
+    _draw_board_grid(draw, margin, size - 2 * margin, size, '#5C4033', 2)
 
-    for i in range(9):
-        x = margin + i * grid_size // 8
-        draw.line([(x, margin), (x, margin + 4 * grid_size // 9)], fill=line_color, width=1)
-        draw.line([(x, margin + 5 * grid_size // 9), (x, size - margin)], fill=line_color, width=1)
+    return wood_img
 
-    # Palace diagonals
-    draw.line([(palace_margin_x, palace_top), (palace_margin_x + palace_width, palace_bottom)], fill=line_color, width=1)
-    draw.line([(palace_margin_x + palace_width, palace_top), (palace_margin_x, palace_bottom)], fill=line_color, width=1)
-    draw.line([(palace_margin_x, palace_mid_bottom), (palace_margin_x + palace_width, palace_mid_top)], fill=line_color, width=1)
-    draw.line([(palace_margin_x + palace_width, palace_mid_bottom), (palace_margin_x, palace_mid_top)], fill=line_color, width=1)
 
-    modern_dark.save(os.path.join(board_dir, 'Board_Modern_Dark.png'))
+def create_modern_board(size, bg_color, line_color):
+    """Create a modern flat style board."""
+    img = Image.new('RGB', (size, size), bg_color)
+    draw = ImageDraw.Draw(img)
 
-    print(f"Board styles created in: {board_dir}")
+    # Board grid lines
+    margin = 80
+    _draw_board_grid(draw, margin, size - 2 * margin, size, line_color, 1)
 
+    return img
 
-def create_pieces():
-    """Create traditional and modern style pieces."""
+
+def _piece_jobs():
+    """Return (piece_dir, jobs) for the traditional and modern pieces."""
     piece_dir = os.path.join(ASSETS_DIR, 'PieceStyles')
 
     # Piece names
@@ -282,39 +330,38 @@ def create_pieces():
     black_pieces = ['将', '士', '象', '马', '车', '砲', '卒']
 
     sizes = [64, 128, 256]
+    styles = [
+        ('Traditional', create_traditional_piece),
+        ('Modern', create_modern_piece),
+    ]
 
+    jobs = []
     for size in sizes:
-        # Traditional style
-        trad_dir = os.path.join(piece_dir, 'Traditional', str(size))
-        os.makedirs(trad_dir, exist_ok=True)
+        for style, factory in styles:
+            style_dir = os.path.join(piece_dir, style, str(size))
+            os.makedirs(style_dir, exist_ok=True)
 
-        for i, (red_char, black_char) in enumerate(zip(red_pieces, black_pieces)):
-            # Red piece
-            img = create_traditional_piece(size, red_char, 'red')
-            img.save(os.path.join(trad_dir, f'Red_{i}.png'))
+            for i, (red_char, black_char) in enumerate(zip(red_pieces, black_pieces)):
+                jobs.append((factory, (size, red_char, 'red'),
+                             os.path.join(style_dir, f'Red_{i}.png')))
+                jobs.append((factory, (size, black_char, 'black'),
+                             os.path.join(style_dir, f'Black_{i}.png')))
 
-            # Black piece
-            img = create_traditional_piece(size, black_char, 'black')
-            img.save(os.path.join(trad_dir, f'Black_{i}.png'))
+    return piece_dir, jobs
 
-        # Modern style
-        modern_dir = os.path.join(piece_dir, 'Modern', str(size))
-        os.makedirs(modern_dir, exist_ok=True)
 
-        for i, (red_char, black_char) in enumerate(zip(red_pieces, black_pieces)):
-            # Red piece
-            img = create_modern_piece(size, red_char, 'red')
-            img.save(os.path.join(modern_dir, f'Red_{i}.png'))
-
-            # Black piece
-            img = create_modern_piece(size, black_char, 'black')
-            img.save(os.path.join(modern_dir, f'Black_{i}.png'))
+def create_pieces():
+    """Create traditional and modern style pieces."""
+    piece_dir, jobs = _piece_jobs()
+    # Each worker process keeps its own _load_font cache
+    _render_all(jobs)
 
     print(f"Pieces created in: {piece_dir}")
 
 
-def create_traditional_piece(size, char, color):
-    """Create a traditional style piece."""
+@lru_cache(maxsize=None)
+def _traditional_piece_template(size, color):
+    """Create the blank disk (border and background) of a traditional piece."""
     img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
     draw = ImageDraw.Draw(img)
 
@@ -322,14 +369,8 @@ def create_traditional_piece(size, char, color):
     radius = int(size * 0.45)
 
     # Colors
-    if color == 'red':
-        border_color = '#CC0000'
-        bg_color = '#F5F0E6'
-        text_color = '#CC0000'
-    else:
-        border_color = '#1A1A1A'
-        bg_color = '#F5F0E6'
-        text_color = '#1A1A1A'
+    border_color = '#CC0000' if color == 'red' else '#1A1A1A'
+    bg_color = '#F5F0E6'
 
     # Outer border (thicker)
     draw.ellipse(
@@ -345,27 +386,19 @@ def create_traditional_piece(size, char, color):
         fill=bg_color
     )
 
+    return img
+
+
+def create_traditional_piece(size, char, color):
+    """Create a traditional style piece."""
+    img = _traditional_piece_template(size, color).copy()
+    draw = ImageDraw.Draw(img)
+
+    center = size // 2
+    text_color = '#CC0000' if color == 'red' else '#1A1A1A'
+
     # Character
-    try:
-        font_size = int(size * 0.55)
-        # Try different font paths
-        font_paths = [
-            "/System/Library/Fonts/STHeiti Light.ttc",
-            "/System/Library/Fonts/PingFang.ttc",
-            "/System/Library/Fonts/Hiragino Sans GB.ttc",
-        ]
-        font = None
-        for path in font_paths:
-            if os.path.exists(path):
-                try:
-                    font = ImageFont.truetype(path, font_size)
-                    break
-                except:
-                    continue
-        if font is None:
-            font = ImageFont.load_default()
-    except:
-        font = ImageFont.load_default()
+    font = _load_font(int(size * 0.55))
 
     # Get text bounding box
     bbox = draw.textbbox((0, 0), char, font=font)
@@ -379,8 +412,9 @@ def create_traditional_piece(size, char, color):
     return img
 
 
-def create_modern_piece(size, char, color):
-    """Create a modern flat style piece."""
+@lru_cache(maxsize=None)
+def _modern_piece_template(size, color):
+    """Create the blank disk (shadow and main circle) of a modern piece."""
     img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
     draw = ImageDraw.Draw(img)
 
@@ -390,11 +424,9 @@ def create_modern_piece(size, char, color):
     # Colors - modern flat style
     if color == 'red':
         bg_color = '#FF3B30'
-        text_color = '#FFFFFF'
         shadow_color = '#CC2E24'
     else:
         bg_color = '#1C1C1E'
-        text_color = '#FFFFFF'
         shadow_color = '#000000'
 
     # Shadow (offset)
@@ -412,26 +444,19 @@ def create_modern_piece(size, char, color):
         fill=bg_color
     )
 
+    return img
+
+
+def create_modern_piece(size, char, color):
+    """Create a modern flat style piece."""
+    img = _modern_piece_template(size, color).copy()
+    draw = ImageDraw.Draw(img)
+
+    center = size // 2
+    text_color = '#FFFFFF'
+
     # Character
-    try:
-        font_size = int(size * 0.5)
-        font_paths = [
-            "/System/Library/Fonts/STHeiti Light.ttc",
-            "/System/Library/Fonts/PingFang.ttc",
-            "/System/Library/Fonts/Hiragino Sans GB.ttc",
-        ]
-        font = None
-        for path in font_paths:
-            if os.path.exists(path):
-                try:
-                    font = ImageFont.truetype(path, font_size)
-                    break
-                except:
-                    continue
-        if font is None:
-            font = ImageFont.load_default()
-    except:
-        font = ImageFont.load_default()
+    font = _load_font(int(size * 0.5))
 
     bbox = draw.textbbox((0, 0), char, font=font)
     text_width = bbox[2] - bbox[0]
@@ -444,6 +469,68 @@ def create_modern_piece(size, char, color):
     return img
 
 
+def _toolbar_icon_master(icon_type, color):
+    """Draw a toolbar icon once at TOOLBAR_MASTER_SIZE."""
+    size = TOOLBAR_MASTER_SIZE
+    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
+
+    center = size // 2
+    stroke = size // 12
+
+    if icon_type == 'new':
+        # Plus icon
+        draw.line([(center, stroke), (center, size-stroke)], fill=color, width=stroke)
+        draw.line([(stroke, center), (size-stroke, center)], fill=color, width=stroke)
+
+    elif icon_type == 'undo':
+        # Curved arrow back
+        arc_radius = size // 3
+        # Draw arc
+        draw.arc([center - arc_radius, center - arc_radius,
+                 center + arc_radius, center + arc_radius],
+                start=200, end=340, fill=color, width=stroke)
+        # Arrow head
+        arrow_x = center - arc_radius
+        arrow_y = center
+        draw.polygon([(arrow_x, arrow_y), (arrow_x + stroke*2, arrow_y - stroke),
+                     (arrow_x + stroke*2, arrow_y + stroke)], fill=color)
+
+    elif icon_type == 'hint':
+        # Lightbulb
+        bulb_radius = size // 3
+        draw.ellipse([center - bulb_radius, center - bulb_radius - stroke,
+                     center + bulb_radius, center + bulb_radius - stroke],
+                    fill=color, outline=color)
+        # Base
+        draw.rectangle([center - stroke, center + stroke,
+                       center + stroke, center + bulb_radius + stroke*2],
+                      fill=color)
+
+    elif icon_type == 'settings':
+        # Gear (simplified as circle with dots)
+        gear_radius = size // 3
+        draw.ellipse([center - gear_radius, center - gear_radius,
+                     center + gear_radius, center + gear_radius],
+                    outline=color, width=stroke)
+        # Center dot
+        draw.ellipse([center - stroke, center - stroke,
+                     center + stroke, center + stroke],
+                    fill=color)
+
+    elif icon_type == 'analysis':
+        # Graph/chart icon
+        # Axes
+        draw.line([(stroke*2, size-stroke*2), (stroke*2, stroke*2)], fill=color, width=stroke)
+        draw.line([(stroke*2, size-stroke*2), (size-stroke*2, size-stroke*2)], fill=color, width=stroke)
+        # Trend line
+        points = [(stroke*4, size-stroke*4), (size//3, size//2),
+                 (size//2, size//3), (size-stroke*4, stroke*4)]
+        draw.line(points, fill=color, width=stroke)
+
+    return img
+
+
 def create_toolbar_icons():
     """Create toolbar icons for the application."""
     toolbar_dir = os.path.join(ASSETS_DIR, 'Toolbar')
@@ -460,62 +547,11 @@ def create_toolbar_icons():
     sizes = [18, 24, 36]
 
     for icon_name, (icon_type, color) in icons.items():
+        # Supersample: downscale one large master instead of drawing each
+        # size with integer-width strokes
+        master = _toolbar_icon_master(icon_type, color)
         for size in sizes:
-            img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-            draw = ImageDraw.Draw(img)
-
-            center = size // 2
-            stroke = max(1, size // 12)
-
-            if icon_type == 'new':
-                # Plus icon
-                draw.line([(center, stroke), (center, size-stroke)], fill=color, width=stroke)
-                draw.line([(stroke, center), (size-stroke, center)], fill=color, width=stroke)
-
-            elif icon_type == 'undo':
-                # Curved arrow back
-                arc_radius = size // 3
-                # Draw arc
-                draw.arc([center - arc_radius, center - arc_radius,
-                         center + arc_radius, center + arc_radius],
-                        start=200, end=340, fill=color, width=stroke)
-                # Arrow head
-                arrow_x = center - arc_radius
-                arrow_y = center
-                draw.polygon([(arrow_x, arrow_y), (arrow_x + stroke*2, arrow_y - stroke),
-                             (arrow_x + stroke*2, arrow_y + stroke)], fill=color)
-
-            elif icon_type == 'hint':
-                # Lightbulb
-                bulb_radius = size // 3
-                draw.ellipse([center - bulb_radius, center - bulb_radius - stroke,
-                             center + bulb_radius, center + bulb_radius - stroke],
-                            fill=color, outline=color)
-                # Base
-                draw.rectangle([center - stroke, center + stroke,
-                               center + stroke, center + bulb_radius + stroke*2],
-                              fill=color)
-
-            elif icon_type == 'settings':
-                # Gear (simplified as circle with dots)
-                gear_radius = size // 3
-                draw.ellipse([center - gear_radius, center - gear_radius,
-                             center + gear_radius, center + gear_radius],
-                            outline=color, width=stroke)
-                # Center dot
-                draw.ellipse([center - stroke, center - stroke,
-                             center + stroke, center + stroke],
-                            fill=color)
-
-            elif icon_type == 'analysis':
-                # Graph/chart icon
-                # Axes
-                draw.line([(stroke*2, size-stroke*2), (stroke*2, stroke*2)], fill=color, width=stroke)
-                draw.line([(stroke*2, size-stroke*2), (size-stroke*2, size-stroke*2)], fill=color, width=stroke)
-                # Trend line
-                points = [(stroke*4, size-stroke*4), (size//3, size//2),
-                         (size//2, size//3), (size-stroke*4, stroke*4)]
-                draw.line(points, fill=color, width=stroke)
+            img = master.resize((size, size), Image.Resampling.LANCZOS)
 
             # Save at 1x and 2x
             scale_suffix = '' if size <= 24 else '@2x'
@@ -533,19 +569,11 @@ def create_ui_elements():
     size = 256
 
     # Selection highlight
-    selection = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(selection)
     center = size // 2
     radius = size // 2 - 10
 
     # Glowing ring
-    for i in range(10, 0, -1):
-        alpha = int(50 - i * 4)
-        draw.ellipse(
-            [center - radius - i, center - radius - i,
-             center + radius + i, center + radius + i],
-            outline=(0, 122, 255, alpha), width=2
-        )
+    selection = create_ring_glow(size, (0, 122, 255), radius + 1, peak=46, sigma=8)
 
     selection.save(os.path.join(ui_dir, 'Selection_Highlight.png'))
 
@@ -563,17 +591,8 @@ def create_ui_elements():
     move_dot.save(os.path.join(ui_dir, 'Move_Indicator.png'))
 
     # Check warning (pulsing effect)
-    check_warning = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(check_warning)
-
     radius = size // 2 - 10
-    for i in range(5, 0, -1):
-        alpha = int(100 - i * 15)
-        draw.ellipse(
-            [center - radius - i*3, center - radius - i*3,
-             center + radius + i*3, center + radius + i*3],
-            outline=(255, 59, 48, alpha), width=3
-        )
+    check_warning = create_ring_glow(size, (255, 59, 48), radius + 1, peak=85, sigma=12)
 
     check_warning.save(os.path.join(ui_dir, 'Check_Warning.png'))
 
@@ -594,39 +613,46 @@ def create_ui_elements():
     print(f"UI elements created in: {ui_dir}")
 
 
+def _run_step(step):
+    """Run one top-level generation step (executor worker entry point)."""
+    step()
+
+
 def main():
     """Generate all assets."""
     print("Starting asset generation...")
 
-    # Create app icon
-    print("\n1. Creating app icon...")
-    create_app_icon()
-
-    # Create board styles
-    print("\n2. Creating board styles...")
-    create_board_styles()
-
-    # Create pieces
-    print("\n3. Creating pieces...")
-    create_pieces()
-
-    # Create toolbar icons
-    print("\n4. Creating toolbar icons...")
-    create_toolbar_icons()
-
-    # Create UI elements
-    print("\n5. Creating UI elements...")
-    create_ui_elements()
-
-    # Create launch screen
-    print("\n6. Creating launch screen...")
-    create_launch_screen()
+    # Everything runs in one process pool: the small steps as a single task
+    # each, and boards, pieces and launch screens as one task per image.
+    # Outputs go to disjoint directories, so tasks finish in any order.
+    tasks = [
+        ('App icon', _run_step, (create_app_icon,)),
+        ('Toolbar icons', _run_step, (create_toolbar_icons,)),
+        ('UI elements', _run_step, (create_ui_elements,)),
+    ]
+    for label, job_builder in [
+        ('Board styles', _board_style_jobs),
+        ('Pieces', _piece_jobs),
+        ('Launch screen', _launch_screen_jobs),
+    ]:
+        _, jobs = job_builder()
+        tasks.extend((label, _render_asset, job) for job in jobs)
+
+    remaining = Counter(label for label, _, _ in tasks)
+    with ProcessPoolExecutor() as executor:
+        futures = {executor.submit(fn, *args): label for label, fn, args in tasks}
+        for future in as_completed(futures):
+            future.result()
+            label = futures[future]
+            remaining[label] -= 1
+            if not remaining[label]:
+                print(f"  {label} done")
 
     print("\n✅ All assets generated successfully!")
 
 
-def create_launch_screen():
-    """Create launch screen for the application."""
+def _launch_screen_jobs():
+    """Return (launch_dir, jobs) for the launch screen sizes."""
     launch_dir = os.path.join(ASSETS_DIR, 'LaunchScreen')
     os.makedirs(launch_dir, exist_ok=True)
 
@@ -638,82 +664,70 @@ def create_launch_screen():
         (1600, 1000, 'LaunchScreen_1600x1000'),
     ]
 
-    for width, height, name in sizes:
-        img = Image.new('RGB', (width, height), '#F5F5F7')
-        draw = ImageDraw.Draw(img)
+    return launch_dir, [
+        (create_launch_image, (width, height), os.path.join(launch_dir, f'{name}.png'))
+        for width, height, name in sizes
+    ]
 
-        center_x = width // 2
-        center_y = height // 2
 
-        # Draw a large decorative piece in the center
-        piece_radius = min(width, height) // 8
+def create_launch_screen():
+    """Create launch screen for the application."""
+    launch_dir, jobs = _launch_screen_jobs()
+    _render_all(jobs)
 
-        # Outer red circle
-        draw.ellipse(
-            [center_x - piece_radius, center_y - piece_radius - 40,
-             center_x + piece_radius, center_y + piece_radius - 40],
-            fill='#CC0000', outline='#990000', width=4
-        )
+    print(f"Launch screen created at: {launch_dir}")
 
-        # Inner background
-        inner_radius = int(piece_radius * 0.85)
-        draw.ellipse(
-            [center_x - inner_radius, center_y - inner_radius - 40,
-             center_x + inner_radius, center_y + inner_radius - 40],
-            fill='#F5F0E6'
-        )
 
-        # Try to draw the character
-        try:
-            font_size = int(piece_radius * 1.2)
-            font_paths = [
-                "/System/Library/Fonts/STHeiti Light.ttc",
-                "/System/Library/Fonts/PingFang.ttc",
-                "/System/Library/Fonts/Hiragino Sans GB.ttc",
-            ]
-            font = None
-            for path in font_paths:
-                if os.path.exists(path):
-                    try:
-                        font = ImageFont.truetype(path, font_size)
-                        break
-                    except:
-                        continue
-            if font is None:
-                font = ImageFont.load_default()
-        except:
-            font = ImageFont.load_default()
-
-        text = "棋"
-        bbox = draw.textbbox((0, 0), text, font=font)
-        text_width = bbox[2] - bbox[0]
-        text_height = bbox[3] - bbox[1]
-        text_x = center_x - text_width // 2 - bbox[0]
-        text_y = center_y - text_height // 2 - bbox[1] - 40
-
-        draw.text((text_x, text_y), text, font=font, fill='#CC0000')
-
-        # Add app name below
-        try:
-            name_font = ImageFont.truetype("/System/Library/Fonts/SFProDisplay-Semibold.otf", 36)
-        except:
-            try:
-                name_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 36)
-            except:
-                name_font = ImageFont.load_default()
+def create_launch_image(width, height):
+    """Create a single launch screen image."""
+    img = Image.new('RGB', (width, height), '#F5F5F7')
+    draw = ImageDraw.Draw(img)
 
-        app_name = "Chinese Chess"
-        bbox = draw.textbbox((0, 0), app_name, font=name_font)
-        name_width = bbox[2] - bbox[0]
-        name_x = center_x - name_width // 2
-        name_y = center_y + piece_radius + 20
+    center_x = width // 2
+    center_y = height // 2
 
-        draw.text((name_x, name_y), app_name, font=name_font, fill='#1C1C1E')
+    # Draw a large decorative piece in the center
+    piece_radius = min(width, height) // 8
 
-        # Save
-        img.save(os.path.join(launch_dir, f'{name}.png'))
+    # Outer red circle
+    draw.ellipse(
+        [center_x - piece_radius, center_y - piece_radius - 40,
+         center_x + piece_radius, center_y + piece_radius - 40],
+        fill='#CC0000', outline='#990000', width=4
+    )
 
-    print(f"Launch screen created at: {launch_dir}")
+    # Inner background
+    inner_radius = int(piece_radius * 0.85)
+    draw.ellipse(
+        [center_x - inner_radius, center_y - inner_radius - 40,
+         center_x + inner_radius, center_y + inner_radius - 40],
+        fill='#F5F0E6'
+    )
+
+    # Draw the character
+    font = _load_font(int(piece_radius * 1.2))
+
+    text = "棋"
+    bbox = draw.textbbox((0, 0), text, font=font)
+    text_width = bbox[2] - bbox[0]
+    text_height = bbox[3] - bbox[1]
+    text_x = center_x - text_width // 2 - bbox[0]
+    text_y = center_y - text_height // 2 - bbox[1] - 40
+
+    draw.text((text_x, text_y), text, font=font, fill='#CC0000')
+
+    # Add app name below
+    name_font = _load_name_font(36)
+
+    app_name = "Chinese Chess"
+    bbox = draw.textbbox((0, 0), app_name, font=name_font)
+    name_width = bbox[2] - bbox[0]
+    name_x = center_x - name_width // 2
+    name_y = center_y + piece_radius + 20
+
+    draw.text((name_x, name_y), app_name, font=name_font, fill='#1C1C1E')
+
+    return img
 
 
 if __name__ == '__main__':